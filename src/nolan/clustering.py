@@ -212,6 +212,10 @@ class ClusterAnalyzer:
             summary = seg.combined_summary or seg.frame_description
             segment_summaries.append(f"- {summary}")
 
+        # Each of these walks every segment; compute them once for the prompt
+        people = cluster.people
+        locations = cluster.locations
+
         prompt = f"""Analyze this sequence of continuous video segments and provide a cohesive summary of the story moment they represent.
 
 SEGMENTS ({len(cluster.segments)} total, {cluster.duration:.1f}s duration):
@@ -220,8 +224,8 @@ SEGMENTS ({len(cluster.segments)} total, {cluster.duration:.1f}s duration):
 TRANSCRIPT:
 {cluster.combined_transcript or "(no transcript available)"}
 
-PEOPLE APPEARING: {", ".join(cluster.people) if cluster.people else "(none identified)"}
-LOCATIONS: {", ".join(cluster.locations) if cluster.locations else "(none identified)"}
+PEOPLE APPEARING: {", ".join(people) if people else "(none identified)"}
+LOCATIONS: {", ".join(locations) if locations else "(none identified)"}
 
 Provide a 2-3 sentence summary that captures:
 1. What's happening in this story moment
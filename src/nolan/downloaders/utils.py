@@ -1,13 +1,19 @@
 """Shared utilities for Lottie downloaders."""
 
-import json
 import re
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, List, Protocol, TypeVar
 
 from nolan.downloaders.models import BaseLottieTemplate
+from nolan.lottie import _json_dumps
+
+# sanitize_filename runs once per downloaded template; compile its patterns once
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_HYPHEN_RUN_RE = re.compile(r'-+')
 
 
 def sanitize_filename(name: str, max_length: int = 50) -> str:
@@ -21,11 +27,11 @@ def sanitize_filename(name: str, max_length: int = 50) -> str:
         Safe filename string (lowercase, hyphens instead of spaces).
     """
     # Remove invalid characters
-    name = re.sub(r'[<>:"/\\|?*]', '', name)
+    name = _INVALID_FILENAME_CHARS_RE.sub('', name)
     # Replace whitespace with hyphens
-    name = re.sub(r'\s+', '-', name.strip())
+    name = _WHITESPACE_RE.sub('-', name.strip())
     # Collapse multiple hyphens
-    name = re.sub(r'-+', '-', name)
+    name = _HYPHEN_RUN_RE.sub('-', name)
     # Lowercase and truncate
     return name.lower()[:max_length]
 
@@ -67,13 +73,12 @@ def save_lottie_json(data: dict, output_path: Path, minify: bool = True) -> int:
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        if minify:
-            json.dump(data, f, separators=(",", ":"))
-        else:
-            json.dump(data, f, indent=2)
+    # Serialize once and write the bytes; their length is the file size, so
+    # no stat() round-trip is needed afterwards
+    raw = _json_dumps(data, indent=not minify)
+    output_path.write_bytes(raw)
 
-    return output_path.stat().st_size
+    return len(raw)
 
 
 T = TypeVar('T', bound=BaseLottieTemplate)
@@ -106,31 +111,32 @@ class CatalogBuilder:
         Returns:
             Catalog dictionary.
         """
+        # Group in one pass over the in-memory templates; no filesystem walk
+        categories: dict[str, list[dict]] = {}
+        for template in templates:
+            categories.setdefault(template.category, []).append(template.to_catalog_entry())
+
         catalog = {
             "source": self.source_name,
             "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "total_count": len(templates),
-            "categories": {},
+            "categories": categories,
         }
 
-        for template in templates:
-            cat = template.category
-            if cat not in catalog["categories"]:
-                catalog["categories"][cat] = []
-
-            catalog["categories"][cat].append(template.to_catalog_entry())
-
         # Save catalog
         catalog_path = self.output_dir / catalog_filename
-        with open(catalog_path, "w", encoding="utf-8") as f:
-            json.dump(catalog, f, indent=2)
+        catalog_path.write_bytes(_json_dumps(catalog, indent=True))
 
         print(f"Catalog saved: {catalog_path}")
         return catalog
 
 
 class RateLimiter:
-    """Simple rate limiter to avoid getting blocked."""
+    """Simple rate limiter to avoid getting blocked.
+
+    Thread-safe: each caller claims the next free slot under a lock and then
+    sleeps outside it, so one instance can pace a pool of download workers.
+    """
 
     def __init__(self, requests_per_minute: int = 20):
         """Initialize rate limiter.
@@ -139,23 +145,26 @@ class RateLimiter:
             requests_per_minute: Maximum requests allowed per minute.
         """
         self.min_interval = 60.0 / requests_per_minute
-        self.last_request = 0.0
+        self.last_request = float("-inf")
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Claim the next request slot and return how long to sleep until it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self.last_request + self.min_interval)
+            self.last_request = slot
+            return slot - now
 
     def wait(self):
         """Wait if necessary to respect rate limit."""
-        now = time.time()
-        elapsed = now - self.last_request
-        if elapsed < self.min_interval:
-            sleep_time = self.min_interval - elapsed
+        sleep_time = self._reserve()
+        if sleep_time > 0:
             time.sleep(sleep_time)
-        self.last_request = time.time()
 
     async def wait_async(self):
         """Async version of wait."""
         import asyncio
-        now = time.time()
-        elapsed = now - self.last_request
-        if elapsed < self.min_interval:
-            sleep_time = self.min_interval - elapsed
+        sleep_time = self._reserve()
+        if sleep_time > 0:
             await asyncio.sleep(sleep_time)
-        self.last_request = time.time()
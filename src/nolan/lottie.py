@@ -6,9 +6,87 @@ including text replacement, color transformation, and timing adjustments.
 """
 
 import json
+import numbers
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # transform_colors falls back to per-color calls
+    np = None
+
+# Top-level scalar fields returned by load_lottie_metadata
+_METADATA_FIELDS = ('v', 'nm', 'fr', 'ip', 'op', 'w', 'h')
+
+# Core fields checked by validate_lottie (v is optional - some files omit it)
+_REQUIRED_FIELDS = ('fr', 'ip', 'op', 'w', 'h', 'layers')
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+_POSITIVE_FIELDS = (('fr', 'frame rate'), ('w', 'width'), ('h', 'height'))
+
+# Byte pattern for quick_validate: any "<required field>": key in the raw file
+_REQUIRED_SNIFF_RE = re.compile(rb'"(fr|ip|op|w|h|layers)"\s*:')
+_SNIFF_BYTES = 16 * 1024
+
+# 8-bit channel <-> Lottie unit value / hex pair tables for the color helpers
+_CHANNEL_TO_UNIT = tuple(round(i / 255, 3) for i in range(256))
+_HEX_PAIRS = tuple(f"{i:02x}" for i in range(256))
+
+# Sentinel for memo lookups where None is a meaningful cached value
+_MISSING = object()
+
+# Shape types that carry a static color field, and how analyze_lottie labels them
+_SHAPE_COLOR_TYPES = {'fl': 'fill', 'st': 'stroke'}
+
+# Separators in schema field paths such as "layers[0].shapes[1].c.k"
+_PATH_SPLIT_RE = re.compile(r'\.|\[')
+
+# Below this many colors NumPy setup costs more than the per-color calls
+_VECTORIZE_MIN_COLORS = 64
+
+# Parsed Lottie trees kept by _parse_lottie_cached. Each entry holds a whole
+# parsed file (10-15x its size on disk for the bundled templates), so the
+# default is small. Set NOLAN_LOTTIE_PARSE_CACHE=0 to disable the cache.
+_PARSE_CACHE_SIZE = int(os.environ.get("NOLAN_LOTTIE_PARSE_CACHE", "4"))
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes (compact, or 2-space indented).
+
+    NumPy arrays and scalars (e.g. keyframe values computed in bulk) are
+    written as plain JSON numbers/lists without a tolist() pass first.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, default=_json_default).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+
+def _json_default(obj: Any) -> Any:
+    """Stdlib json fallback for the NumPy values orjson serializes natively."""
+    if np is not None and isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def hex_to_lottie_rgb(hex_color: str) -> list[float]:
@@ -21,14 +99,23 @@ def hex_to_lottie_rgb(hex_color: str) -> list[float]:
     Returns:
         List of [r, g, b] values in 0-1 range
     """
+    # Fresh list per call: callers append alpha or store it in Lottie data
+    return list(_hex_to_rgb(hex_color))
+
+
+@lru_cache(maxsize=4096)
+def _hex_to_rgb(hex_color: str) -> tuple[float, float, float]:
+    """Memoized body of hex_to_lottie_rgb (templates reuse a few colors)."""
     hex_color = hex_color.lstrip('#')
     if len(hex_color) != 6:
         raise ValueError(f"Invalid hex color: {hex_color}")
 
-    r = int(hex_color[0:2], 16) / 255
-    g = int(hex_color[2:4], 16) / 255
-    b = int(hex_color[4:6], 16) / 255
-    return [round(r, 3), round(g, 3), round(b, 3)]
+    # Decode all three channels in one call rather than three int(..., 16)
+    try:
+        r, g, b = bytes.fromhex(hex_color)
+    except ValueError:
+        raise ValueError(f"Invalid hex color: {hex_color}") from None
+    return (_CHANNEL_TO_UNIT[r], _CHANNEL_TO_UNIT[g], _CHANNEL_TO_UNIT[b])
 
 
 def lottie_rgb_to_hex(rgb: list[float]) -> str:
@@ -41,10 +128,17 @@ def lottie_rgb_to_hex(rgb: list[float]) -> str:
     Returns:
         Hex color string (e.g., '#FF5500')
     """
-    r = int(min(1, max(0, rgb[0])) * 255)
-    g = int(min(1, max(0, rgb[1])) * 255)
-    b = int(min(1, max(0, rgb[2])) * 255)
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return _rgb_to_hex(rgb[0], rgb[1], rgb[2])
+
+
+@lru_cache(maxsize=4096)
+def _rgb_to_hex(r: float, g: float, b: float) -> str:
+    """Memoized body of lottie_rgb_to_hex, keyed on the three channels."""
+    # Clamp to 0-1 (NaN falls through to 0) and index the hex-pair table
+    r = int(r * 255) if 0 < r <= 1 else (255 if r > 1 else 0)
+    g = int(g * 255) if 0 < g <= 1 else (255 if g > 1 else 0)
+    b = int(b * 255) if 0 < b <= 1 else (255 if b > 1 else 0)
+    return '#' + _HEX_PAIRS[r] + _HEX_PAIRS[g] + _HEX_PAIRS[b]
 
 
 def validate_lottie(data: dict) -> tuple[bool, str | None]:
@@ -57,26 +151,56 @@ def validate_lottie(data: dict) -> tuple[bool, str | None]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    # Core required fields (v is optional - some files omit it)
-    required_fields = ['fr', 'ip', 'op', 'w', 'h', 'layers']
+    if not isinstance(data, dict):
+        return False, "Lottie root must be a JSON object"
 
-    for field in required_fields:
-        if field not in data:
-            return False, f"Missing required field: {field}"
+    # One subset test on the common (valid) path; only on failure walk the
+    # ordered tuple so the reported field stays deterministic
+    if not _REQUIRED_FIELD_SET <= data.keys():
+        field = next(f for f in _REQUIRED_FIELDS if f not in data)
+        return False, f"Missing required field: {field}"
 
     if not isinstance(data['layers'], list):
         return False, "layers must be a list"
 
-    if not isinstance(data['fr'], (int, float)) or data['fr'] <= 0:
-        return False, "fr (frame rate) must be a positive number"
+    for field, description in _POSITIVE_FIELDS:
+        value = data[field]
+        # numbers.Real also admits NumPy scalars (see _json_dumps); bool doesn't count
+        if not isinstance(value, numbers.Real) or isinstance(value, bool) or value <= 0:
+            return False, f"{field} ({description}) must be a positive number"
 
-    if not isinstance(data['w'], (int, float)) or data['w'] <= 0:
-        return False, "w (width) must be a positive number"
+    return True, None
 
-    if not isinstance(data['h'], (int, float)) or data['h'] <= 0:
-        return False, "h (height) must be a positive number"
 
-    return True, None
+def quick_validate(path: str | Path) -> bool:
+    """
+    Cheaply check whether a JSON file could be a Lottie animation, without parsing it.
+
+    Scans the first 16KB (and only if needed, the rest of the file) for the
+    required field keys. A False result is definitive: the file is not a JSON
+    object or some required key appears nowhere in it. True only means the
+    file is worth loading; use load_lottie/validate_lottie for a full check.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        False if the file is certainly not a valid Lottie animation
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    with open(path, "rb") as f:
+        head = f.read(_SNIFF_BYTES)
+        if not head.lstrip().startswith(b"{"):
+            return False
+
+        found = set(_REQUIRED_SNIFF_RE.findall(head))
+        if len(found) < len(_REQUIRED_FIELDS):
+            # Keys such as w/h often follow large assets; scan the whole file
+            found.update(_REQUIRED_SNIFF_RE.findall(head + f.read()))
+
+    return len(found) == len(_REQUIRED_FIELDS)
 
 
 def load_lottie(path: str | Path) -> dict:
@@ -97,8 +221,7 @@ def load_lottie(path: str | Path) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"Lottie file not found: {path}")
 
-    with open(path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = _json_loads(path.read_bytes())
 
     is_valid, error = validate_lottie(data)
     if not is_valid:
@@ -107,6 +230,71 @@ def load_lottie(path: str | Path) -> dict:
     return data
 
 
+def _load_lottie_readonly(path: str | Path) -> dict:
+    """
+    Load a Lottie file for read-only use, reusing a recent parse.
+
+    Parses are cached by (resolved path, mtime, size), so an edited file is
+    re-read. The returned dict is shared between callers and must not be
+    mutated; code that edits Lottie data should call load_lottie instead
+    (copying a parsed tree costs more than re-parsing it with orjson).
+    """
+    return _parse_lottie_cached(*_file_cache_key(path))
+
+
+def _file_cache_key(path: str | Path) -> tuple[str, int, int]:
+    """(resolved path, mtime_ns, size) key for the per-file parse caches."""
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Lottie file not found: {path}")
+
+    stat = path.stat()
+    return str(path.resolve()), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_lottie_cached(resolved_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Cache slot for _load_lottie_readonly; mtime/size are part of the key.
+
+    Holds up to _PARSE_CACHE_SIZE full parsed trees for the life of the
+    process; a multi-MB template costs several times that in Python objects.
+    """
+    return load_lottie(resolved_path)
+
+
+def load_lottie_metadata(path: str | Path) -> dict:
+    """
+    Read the header fields and layer/asset counts of a Lottie file.
+
+    The file is parsed in full (orjson when available): measured on the
+    bundled assets, that beats streaming the header with an event parser,
+    which still has to scan to the end of the file to count layers.
+
+    Args:
+        path: Path to the Lottie JSON file
+
+    Returns:
+        Dictionary with whichever of v/nm/fr/ip/op/w/h are present, plus
+        'layer_count' and 'asset_count'
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file is not valid JSON or its root isn't an object
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Lottie file not found: {path}")
+
+    data = _json_loads(path.read_bytes())
+    if not isinstance(data, dict):
+        raise ValueError(f"Lottie root must be a JSON object: {path}")
+    meta = {key: data[key] for key in _METADATA_FIELDS if key in data}
+    meta['layer_count'] = len(data.get('layers', ()))
+    meta['asset_count'] = len(data.get('assets', ()))
+    return meta
+
+
 def save_lottie(data: dict, path: str | Path) -> None:
     """
     Save Lottie data to a JSON file.
@@ -118,8 +306,61 @@ def save_lottie(data: dict, path: str | Path) -> None:
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, separators=(',', ':'))
+    path.write_bytes(_json_dumps(data))
+
+
+def _walk_layers(data: dict, path_prefix: str = "layers"):
+    """
+    Yield (index, layer, prefix) for every layer, depth-first, following precomps.
+
+    The layer's path is f"{prefix}[{index}]"; callers build it only for the
+    layers they actually report, instead of one string per layer visited.
+
+    Precomp (ty=0) layers are yielded themselves and then immediately followed
+    by the layers of the asset they reference, matching the order of a
+    recursive walk. Uses an explicit stack of iterators rather than recursion;
+    a precomp that references an asset already being walked is not re-entered.
+    """
+    # Index precomp assets once instead of scanning the list per precomp layer
+    # (ids should be unique, but every asset sharing an id is walked, as before)
+    asset_layers = {}
+    for asset in data.get('assets', ()):
+        if 'layers' in asset:
+            asset_layers.setdefault(asset.get('id'), []).append(asset['layers'])
+
+    stack = [(path_prefix, iter(enumerate(data.get('layers', ()))), None)]
+    active_refs = {}
+
+    while stack:
+        prefix, layers, _ = stack[-1]
+        for i, layer in layers:
+            yield i, layer, prefix
+
+            if layer.get('ty') == 0 and 'refId' in layer:
+                ref_id = layer['refId']
+                if active_refs.get(ref_id):
+                    continue  # precomp cycle
+                matches = asset_layers.get(ref_id)
+                if matches:
+                    # Descend now; this level resumes once the precomp is done
+                    for layers_list in reversed(matches):
+                        stack.append((f"assets[{ref_id}].layers", iter(enumerate(layers_list)), ref_id))
+                    active_refs[ref_id] = len(matches)
+                    break
+        else:
+            _, _, ref_id = stack.pop()
+            if ref_id is not None:
+                active_refs[ref_id] -= 1
+
+
+def _iter_text_layers(data: dict):
+    """Yield (index, layer, prefix, text) for every text layer in walk order."""
+    for i, layer, prefix in _walk_layers(data):
+        # Text layer type is 5
+        if layer.get('ty') == 5:
+            text_data = layer.get('t', {}).get('d', {}).get('k', [])
+            if text_data and isinstance(text_data, list):
+                yield i, layer, prefix, text_data[0].get('s', {}).get('t', '')
 
 
 def get_text_layers(data: dict) -> list[dict]:
@@ -132,34 +373,15 @@ def get_text_layers(data: dict) -> list[dict]:
     Returns:
         List of text layer dictionaries with 'name', 'text', and 'path' keys
     """
-    text_layers = []
-
-    def find_text_layers(layers: list, path_prefix: str = ""):
-        for i, layer in enumerate(layers):
-            layer_path = f"{path_prefix}layers[{i}]"
-
-            # Text layer type is 5
-            if layer.get('ty') == 5:
-                text_data = layer.get('t', {}).get('d', {}).get('k', [])
-                if text_data and isinstance(text_data, list) and len(text_data) > 0:
-                    text_content = text_data[0].get('s', {}).get('t', '')
-                    text_layers.append({
-                        'name': layer.get('nm', f'Text Layer {i}'),
-                        'text': text_content,
-                        'path': layer_path,
-                        'layer': layer
-                    })
-
-            # Check precomp layers
-            if layer.get('ty') == 0 and 'refId' in layer:
-                ref_id = layer['refId']
-                assets = data.get('assets', [])
-                for asset in assets:
-                    if asset.get('id') == ref_id and 'layers' in asset:
-                        find_text_layers(asset['layers'], f"assets[{ref_id}].")
-
-    find_text_layers(data.get('layers', []))
-    return text_layers
+    return [
+        {
+            'name': layer.get('nm', f'Text Layer {i}'),
+            'text': text_content,
+            'path': f"{prefix}[{i}]",
+            'layer': layer
+        }
+        for i, layer, prefix, text_content in _iter_text_layers(data)
+    ]
 
 
 def replace_text(data: dict, old_text: str, new_text: str) -> int:
@@ -174,28 +396,53 @@ def replace_text(data: dict, old_text: str, new_text: str) -> int:
     Returns:
         Number of replacements made
     """
+    return replace_texts(data, {old_text: new_text})
+
+
+def replace_texts(data: dict, replacements: dict[str, str]) -> int:
+    """
+    Apply several text replacements in a single pass over the text layers.
+
+    Replacements are simultaneous: each keyframe's text is looked up once,
+    so {'A': 'B', 'B': 'C'} turns 'A' into 'B' (not 'C').
+
+    Args:
+        data: Lottie data dictionary (modified in place)
+        replacements: Dict mapping old text to new text
+
+    Returns:
+        Number of replacements made
+    """
+    if not replacements:
+        return 0
+
     count = 0
+    # A precomp asset referenced by several layers is walked once per
+    # reference; edit each layer object only once so chains like A->B->C
+    # still apply a single replacement (as _edit_tree does)
+    seen = set()
 
-    def process_layers(layers: list):
-        nonlocal count
-        for layer in layers:
-            if layer.get('ty') == 5:  # Text layer
-                text_data = layer.get('t', {}).get('d', {}).get('k', [])
-                for keyframe in text_data:
-                    if 's' in keyframe and 't' in keyframe['s']:
-                        if keyframe['s']['t'] == old_text:
-                            keyframe['s']['t'] = new_text
-                            count += 1
-
-            # Check precomp layers
-            if layer.get('ty') == 0 and 'refId' in layer:
-                ref_id = layer['refId']
-                assets = data.get('assets', [])
-                for asset in assets:
-                    if asset.get('id') == ref_id and 'layers' in asset:
-                        process_layers(asset['layers'])
+    for _, layer, _ in _walk_layers(data):
+        if layer.get('ty') == 5 and id(layer) not in seen:  # Text layer
+            seen.add(id(layer))
+            count += _replace_layer_text(layer, replacements)
+
+    return count
 
-    process_layers(data.get('layers', []))
+
+def _replace_layer_text(layer: dict, replacements: dict[str, str]) -> int:
+    """Replace matching keyframe text in one text layer; returns the count."""
+    text_doc = layer.get('t')
+    if not isinstance(text_doc, dict) or not isinstance(text_doc.get('d'), dict):
+        return 0  # not a text layer body (e.g. an effect that also uses ty=5)
+
+    count = 0
+    for keyframe in text_doc['d'].get('k', []):
+        props = keyframe.get('s') if isinstance(keyframe, dict) else None
+        if isinstance(props, dict) and isinstance(props.get('t'), str):
+            if props['t'] in replacements:
+                props['t'] = replacements[props['t']]
+                count += 1
     return count
 
 
@@ -215,61 +462,171 @@ def transform_colors(
     Returns:
         Number of colors transformed
     """
-    count = 0
+    if not color_map and transform_fn is None:
+        return 0  # nothing could match; skip the walk
+
+    _, count = _edit_tree(
+        data,
+        color_lookup=_build_color_lookup(color_map),
+        transform_fn=transform_fn,
+    )
+    return count
 
-    # Build color lookup if color_map provided
+
+def _build_color_lookup(color_map: dict[str, str] | None) -> dict[tuple, list[float]]:
+    """Map old colors (as _color_key tuples) to new Lottie RGB values."""
     color_lookup = {}
     if color_map:
         for old_hex, new_hex in color_map.items():
-            old_rgb = hex_to_lottie_rgb(old_hex)
-            new_rgb = hex_to_lottie_rgb(new_hex)
-            # Use rounded key for matching
-            key = tuple(round(v, 2) for v in old_rgb)
-            color_lookup[key] = new_rgb
-
-    def process_value(obj: Any, depth: int = 0) -> None:
-        nonlocal count
-        if depth > 50:  # Prevent infinite recursion
-            return
-
-        if isinstance(obj, dict):
-            # Check for color arrays in 'k' or 'c' keys
-            for key in ['k', 'c']:
-                if key in obj:
-                    val = obj[key]
-                    if isinstance(val, list) and len(val) in [3, 4]:
-                        # Check if it looks like a color (all values 0-1)
-                        if all(isinstance(v, (int, float)) and 0 <= v <= 1 for v in val[:3]):
-                            rgb = val[:3]
-                            new_rgb = None
-
-                            # Try color map first
-                            if color_lookup:
-                                lookup_key = tuple(round(v, 2) for v in rgb)
-                                if lookup_key in color_lookup:
-                                    new_rgb = color_lookup[lookup_key]
-
-                            # Then try transform function
-                            if new_rgb is None and transform_fn:
-                                new_rgb = transform_fn(rgb)
-
-                            if new_rgb and new_rgb != rgb:
-                                if len(val) == 4:
-                                    obj[key] = [new_rgb[0], new_rgb[1], new_rgb[2], val[3]]
-                                else:
-                                    obj[key] = new_rgb
-                                count += 1
-
-            # Recurse into all dict values
-            for v in obj.values():
-                process_value(v, depth + 1)
-
-        elif isinstance(obj, list):
-            for item in obj:
-                process_value(item, depth + 1)
-
-    process_value(data)
-    return count
+            color_lookup[_color_key(hex_to_lottie_rgb(old_hex))] = hex_to_lottie_rgb(new_hex)
+    return color_lookup
+
+
+def _color_key(rgb: list[float]) -> tuple[float, float, float]:
+    """
+    Quantize a 0-1 RGB color to hundredths for color_map matching.
+
+    Uses round(v, 2), whose ties follow the exact binary value (0.945 rounds
+    to 0.94); a "+0.5 then truncate" shortcut rounds those up and changes
+    which colors match. _edit_tree memoizes keys per raw triple, so the
+    round() calls aren't on the hot path.
+    """
+    return (round(rgb[0], 2), round(rgb[1], 2), round(rgb[2], 2))
+
+
+def _edit_tree(
+    data: dict,
+    text_replacements: dict[str, str] = None,
+    color_lookup: dict[tuple, list[float]] = None,
+    transform_fn: callable = None
+) -> tuple[int, int]:
+    """
+    Apply text replacements and color rewrites in one walk over every node.
+
+    Text is replaced in any text layer (ty=5) the walk reaches, colors in any
+    'k'/'c' value that looks like an RGB(A) array. The color map wins over
+    transform_fn, which is applied to the remaining colors in one batch.
+
+    Returns:
+        Tuple of (text replacements made, colors transformed)
+    """
+    text_count = 0
+    color_count = 0
+    if not (text_replacements or color_lookup or transform_fn):
+        return text_count, color_count
+
+    # Specialize once instead of re-testing per node: which of the three
+    # edits (text, color map, transform_fn) this walk actually performs
+    lookup_color = color_lookup.get if color_lookup else None
+    lookup_memo = {}
+    do_text = bool(text_replacements)
+    do_transform = transform_fn is not None
+    do_colors = lookup_color is not None or do_transform
+
+    # Color lists the map didn't cover; transform_fn is applied to all of
+    # them in one batch after the walk, and results are written in place
+    pending = []
+
+    # Hot loop: bind methods and builtins to locals once
+    _isinstance, _len, _id, _color_key_ = isinstance, len, id, _color_key
+    containers = (dict, list)
+    queue_pending = pending.append
+
+    # Only dicts/lists are pushed. Each container is visited once (by id),
+    # which guards against shared or cyclic references without a depth cap.
+    visited = set()
+    mark_visited = visited.add
+    stack = [data]
+    pop, push = stack.pop, stack.extend
+
+    while stack:
+        obj = pop()
+        obj_id = _id(obj)
+        if obj_id in visited:
+            continue
+        mark_visited(obj_id)
+
+        if _isinstance(obj, dict):
+            obj_get = obj.get
+
+            # Text layer
+            if do_text and obj_get('ty') == 5:
+                text_count += _replace_layer_text(obj, text_replacements)
+
+            # Check for color arrays in 'k' or 'c' keys (one probe each; a
+            # missing key yields None and fails the list check)
+            for val in ((obj_get('k'), obj_get('c')) if do_colors else ()):
+                if type(val) is not list or _len(val) not in (3, 4):
+                    continue
+
+                # Check if it looks like a color (all values 0-1). Exact type
+                # checks, first channel first: most candidates fail at once.
+                v0 = val[0]
+                t0 = type(v0)
+                if not ((t0 is float or t0 is int) and 0 <= v0 <= 1):
+                    continue
+                v1, v2 = val[1], val[2]
+                t1, t2 = type(v1), type(v2)
+                if not ((t1 is float or t1 is int) and 0 <= v1 <= 1
+                        and (t2 is float or t2 is int) and 0 <= v2 <= 1):
+                    continue
+
+                # Try color map first. Files repeat a handful of exact colors,
+                # so memoize the quantized lookup (hit or miss) per raw triple.
+                if lookup_color is not None:
+                    raw = (v0, v1, v2)
+                    new_rgb = lookup_memo.get(raw, _MISSING)
+                    if new_rgb is _MISSING:
+                        new_rgb = lookup_memo[raw] = lookup_color(_color_key_(raw))
+                    if new_rgb is not None:
+                        if _apply_rgb(val, new_rgb):
+                            color_count += 1
+                        continue
+
+                # Then queue for the transform function
+                if do_transform:
+                    queue_pending(val)
+
+            # Visit nested containers
+            push([v for v in obj.values() if _isinstance(v, containers)])
+
+        else:
+            push([item for item in obj if _isinstance(item, containers)])
+
+    if pending:
+        for val, new_rgb in zip(pending, _batch_transform(transform_fn, pending)):
+            if _apply_rgb(val, new_rgb):
+                color_count += 1
+
+    return text_count, color_count
+
+
+def _apply_rgb(val: list, new_rgb: list[float] | None) -> bool:
+    """Overwrite the RGB channels of val in place (alpha untouched). True if changed."""
+    if not new_rgb:
+        return False
+    r, g, b = new_rgb[0], new_rgb[1], new_rgb[2]
+    if r == val[0] and g == val[1] and b == val[2]:
+        return False
+    val[0], val[1], val[2] = r, g, b
+    return True
+
+
+def _batch_transform(transform_fn: callable, pending: list[list]) -> list:
+    """
+    Apply transform_fn to every queued color list.
+
+    The preset transforms have NumPy kernels that handle the whole batch in
+    one pass; anything else (or small batches) goes through transform_fn
+    one color at a time.
+    """
+    if (np is None or len(pending) < _VECTORIZE_MIN_COLORS
+            or transform_fn not in _VECTORIZED_TRANSFORMS):
+        return [transform_fn(val[:3]) for val in pending]
+
+    kernel = _color_kernels()[transform_fn]
+    arr = np.array([val[:3] for val in pending], dtype=np.float64)
+    return _round3(kernel(arr)).tolist()
 
 
 def set_duration(data: dict, frames: int = None, seconds: float = None) -> None:
@@ -370,14 +727,14 @@ def customize_lottie(
     """
     data = load_lottie(input_path)
 
-    # Apply text replacements
-    if text_replacements:
-        for old_text, new_text in text_replacements.items():
-            replace_text(data, old_text, new_text)
-
-    # Apply color transformations
-    if color_map or color_transform:
-        transform_colors(data, transform_fn=color_transform, color_map=color_map)
+    # Apply text replacements and color transformations in one walk
+    if text_replacements or color_map or color_transform:
+        _edit_tree(
+            data,
+            text_replacements=text_replacements,
+            color_lookup=_build_color_lookup(color_map),
+            transform_fn=color_transform,
+        )
 
     # Set timing
     if duration_frames is not None or duration_seconds is not None:
@@ -396,6 +753,32 @@ def customize_lottie(
     return data
 
 
+def customize_lottie_batch(jobs: list[dict], max_workers: int = None) -> list[dict]:
+    """
+    Run customize_lottie over many files concurrently.
+
+    Each job is a dict of customize_lottie keyword arguments and must include
+    input_path and output_path. Jobs touch disjoint data, so they run on a
+    thread pool; the overlap mostly comes from file reads and writes.
+
+    Args:
+        jobs: List of customize_lottie keyword-argument dicts
+        max_workers: Thread count (default: one per CPU, capped at len(jobs))
+
+    Returns:
+        The modified Lottie data for each job, in job order
+
+    Raises:
+        The first exception raised by any job
+    """
+    if not jobs:
+        return []
+
+    workers = max_workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as ex:
+        return list(ex.map(lambda job: customize_lottie(**job), jobs))
+
+
 def get_lottie_info(path: str | Path) -> dict:
     """
     Get information about a Lottie animation file.
@@ -406,7 +789,21 @@ def get_lottie_info(path: str | Path) -> dict:
     Returns:
         Dictionary with animation metadata
     """
-    data = load_lottie(path)
+    info = _lottie_info_cached(*_file_cache_key(path))
+    # Fresh containers per call so callers can't modify the cached entry
+    return {**info, 'text_layers': [dict(t) for t in info['text_layers']]}
+
+
+@lru_cache(maxsize=128)
+def _lottie_info_cached(resolved_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Cache slot for get_lottie_info; mtime/size are part of the key.
+
+    Entries are the small summary dicts built below (header numbers plus
+    text layer names/strings), not the parsed trees, so 128 of them cost
+    well under a megabyte.
+    """
+    data = _parse_lottie_cached(resolved_path, mtime_ns, size)
 
     fps = data.get('fr', 30)
     ip = data.get('ip', 0)
@@ -414,8 +811,6 @@ def get_lottie_info(path: str | Path) -> dict:
     total_frames = op - ip
     duration_seconds = total_frames / fps if fps > 0 else 0
 
-    text_layers = get_text_layers(data)
-
     return {
         'version': data.get('v', 'unknown'),
         'name': data.get('nm', 'Untitled'),
@@ -426,11 +821,12 @@ def get_lottie_info(path: str | Path) -> dict:
         'out_point': op,
         'total_frames': total_frames,
         'duration_seconds': round(duration_seconds, 2),
-        'layer_count': len(data.get('layers', [])),
-        'asset_count': len(data.get('assets', [])),
+        'layer_count': len(data.get('layers', ())),
+        'asset_count': len(data.get('assets', ())),
+        # Only name/text are reported, so skip building full layer records
         'text_layers': [
-            {'name': t['name'], 'text': t['text']}
-            for t in text_layers
+            {'name': layer.get('nm', f'Text Layer {i}'), 'text': text_content}
+            for i, layer, _, text_content in _iter_text_layers(data)
         ]
     }
 
@@ -461,6 +857,98 @@ def invert_transform(rgb: list[float]) -> list[float]:
     return [round(1 - rgb[0], 3), round(1 - rgb[1], 3), round(1 - rgb[2], 3)]
 
 
+# Vectorized equivalents of the presets for transform_colors. Each takes an
+# (N, 3) float array and mirrors the scalar arithmetic exactly; rounding is
+# done by _round3 so results match round(v, 3).
+def _cyberpunk_kernel(arr):
+    r, g, b = arr.T
+    return np.stack([
+        np.minimum(1, r * 0.5 + g * 0.3 + 0.2),
+        np.minimum(1, g * 0.3 + b * 0.5),
+        np.minimum(1, b * 0.8 + r * 0.2 + 0.1),
+    ], axis=1)
+
+
+def _noir_kernel(arr):
+    r, g, b = arr.T
+    gray = r * 0.299 + g * 0.587 + b * 0.114
+    return np.stack([
+        np.minimum(1, gray * 1.1),
+        np.minimum(1, gray * 1.0),
+        np.minimum(1, gray * 0.9),
+    ], axis=1)
+
+
+def _invert_kernel(arr):
+    return 1 - arr
+
+
+# With Numba installed the cyberpunk/noir kernels are JIT-compiled into a
+# single fused loop (no per-channel temporaries). fastmath stays off: it
+# would reorder the arithmetic and break parity with the scalar presets.
+def _cyberpunk_loop(arr):
+    out = np.empty_like(arr)
+    for i in range(arr.shape[0]):
+        r, g, b = arr[i, 0], arr[i, 1], arr[i, 2]
+        out[i, 0] = min(1.0, r * 0.5 + g * 0.3 + 0.2)
+        out[i, 1] = min(1.0, g * 0.3 + b * 0.5)
+        out[i, 2] = min(1.0, b * 0.8 + r * 0.2 + 0.1)
+    return out
+
+
+def _noir_loop(arr):
+    out = np.empty_like(arr)
+    for i in range(arr.shape[0]):
+        gray = arr[i, 0] * 0.299 + arr[i, 1] * 0.587 + arr[i, 2] * 0.114
+        out[i, 0] = min(1.0, gray * 1.1)
+        out[i, 1] = min(1.0, gray * 1.0)
+        out[i, 2] = min(1.0, gray * 0.9)
+    return out
+
+
+_VECTORIZED_TRANSFORMS = {
+    cyberpunk_transform: _cyberpunk_kernel,
+    noir_transform: _noir_kernel,
+    invert_transform: _invert_kernel,
+}
+
+
+@lru_cache(maxsize=None)
+def _color_kernels() -> dict:
+    """
+    Kernel table used by _batch_transform, built on the first large batch.
+
+    numba is imported here rather than at module level: it adds ~250ms to
+    importing this module, which most callers (catalog, schema I/O) never
+    need. Without numba the NumPy kernels are used.
+    """
+    kernels = dict(_VECTORIZED_TRANSFORMS)
+    try:
+        import numba
+    except ImportError:
+        return kernels
+
+    kernels[cyberpunk_transform] = numba.njit(cache=True)(_cyberpunk_loop)
+    kernels[noir_transform] = numba.njit(cache=True)(_noir_loop)
+    return kernels
+
+
+def _round3(arr):
+    """
+    Round to 3 decimals with the same results as Python's round(v, 3).
+
+    np.round scales by 1000 and rounds half-to-even on the scaled value, which
+    disagrees with round() on near-ties (common, since Lottie colors are
+    themselves 3-decimal values); those few entries are rounded in Python.
+    """
+    scaled = arr * 1000
+    result = np.rint(scaled) / 1000
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        result[near_tie] = [round(v, 3) for v in arr[near_tie].tolist()]
+    return result
+
+
 # =============================================================================
 # Template Schema System
 # =============================================================================
@@ -481,7 +969,7 @@ def analyze_lottie(path: str | Path) -> dict:
     Returns:
         Analysis dictionary with all customizable fields
     """
-    data = load_lottie(path)
+    data = _load_lottie_readonly(path)
 
     analysis = {
         "text_fields": [],
@@ -502,25 +990,17 @@ def analyze_lottie(path: str | Path) -> dict:
     }
 
     # Find text fields
-    _find_text_fields(data, data.get("layers", []), "layers", analysis["text_fields"])
+    _find_text_fields(data, analysis["text_fields"])
 
     # Find color fields
-    _find_color_fields(data, data.get("layers", []), "layers", analysis["color_fields"])
+    _find_color_fields(data, analysis["color_fields"])
 
     return analysis
 
 
-def _find_text_fields(
-    root_data: dict,
-    layers: list,
-    path_prefix: str,
-    results: list
-) -> None:
-    """Recursively find text layers in Lottie data."""
-    for i, layer in enumerate(layers):
-        layer_path = f"{path_prefix}[{i}]"
-        layer_name = layer.get("nm", f"Layer {i}")
-
+def _find_text_fields(root_data: dict, results: list) -> None:
+    """Find text layers in Lottie data, including those inside precomps."""
+    for i, layer, prefix in _walk_layers(root_data):
         # Text layer (ty=5)
         if layer.get("ty") == 5:
             text_data = layer.get("t", {}).get("d", {}).get("k", [])
@@ -529,8 +1009,8 @@ def _find_text_fields(
                 text_content = text_props.get("t", "")
 
                 field = {
-                    "name": layer_name,
-                    "path": f"{layer_path}.t.d.k[0].s.t",
+                    "name": layer.get("nm", f"Layer {i}"),
+                    "path": f"{prefix}[{i}].t.d.k[0].s.t",
                     "current_value": text_content,
                     "type": "text",
                     "properties": {}
@@ -550,50 +1030,17 @@ def _find_text_fields(
 
                 results.append(field)
 
-        # Precomp layer (ty=0) - recurse into assets
-        if layer.get("ty") == 0 and "refId" in layer:
-            ref_id = layer["refId"]
-            for asset in root_data.get("assets", []):
-                if asset.get("id") == ref_id and "layers" in asset:
-                    _find_text_fields(
-                        root_data,
-                        asset["layers"],
-                        f"assets[{ref_id}].layers",
-                        results
-                    )
 
+def _find_color_fields(root_data: dict, results: list) -> None:
+    """Find fill/stroke color fields in Lottie data, including precomps."""
+    seen_colors = set()
 
-def _find_color_fields(
-    root_data: dict,
-    layers: list,
-    path_prefix: str,
-    results: list,
-    seen_colors: set = None
-) -> None:
-    """Recursively find color fields in Lottie data."""
-    if seen_colors is None:
-        seen_colors = set()
-
-    for i, layer in enumerate(layers):
-        layer_path = f"{path_prefix}[{i}]"
-        layer_name = layer.get("nm", f"Layer {i}")
-
+    for i, layer, prefix in _walk_layers(root_data):
         # Process shapes
-        shapes = layer.get("shapes", [])
-        _find_colors_in_shapes(shapes, f"{layer_path}.shapes", layer_name, results, seen_colors)
-
-        # Precomp layer - recurse into assets
-        if layer.get("ty") == 0 and "refId" in layer:
-            ref_id = layer["refId"]
-            for asset in root_data.get("assets", []):
-                if asset.get("id") == ref_id and "layers" in asset:
-                    _find_color_fields(
-                        root_data,
-                        asset["layers"],
-                        f"assets[{ref_id}].layers",
-                        results,
-                        seen_colors
-                    )
+        shapes = layer.get("shapes")
+        if shapes:
+            layer_name = layer.get("nm", f"Layer {i}")
+            _find_colors_in_shapes(shapes, f"{prefix}[{i}].shapes", layer_name, results, seen_colors)
 
 
 def _find_colors_in_shapes(
@@ -603,51 +1050,43 @@ def _find_colors_in_shapes(
     results: list,
     seen_colors: set
 ) -> None:
-    """Find colors in shape layers."""
-    for i, shape in enumerate(shapes):
-        shape_path = f"{path_prefix}[{i}]"
-        shape_type = shape.get("ty", "")
-        shape_name = shape.get("nm", f"Shape {i}")
-
-        # Fill (fl)
-        if shape_type == "fl":
-            color_data = shape.get("c", {})
-            color_val = color_data.get("k", [])
-            if isinstance(color_val, list) and len(color_val) >= 3:
-                # Check if it's static color (not animated)
-                if all(isinstance(v, (int, float)) for v in color_val[:3]):
-                    hex_color = lottie_rgb_to_hex(color_val[:3])
-                    color_key = f"fill:{hex_color}"
-                    if color_key not in seen_colors:
-                        seen_colors.add(color_key)
-                        results.append({
-                            "name": f"{layer_name} / {shape_name}",
-                            "path": f"{shape_path}.c.k",
-                            "current_value": hex_color,
-                            "type": "fill"
-                        })
-
-        # Stroke (st)
-        elif shape_type == "st":
-            color_data = shape.get("c", {})
-            color_val = color_data.get("k", [])
-            if isinstance(color_val, list) and len(color_val) >= 3:
-                if all(isinstance(v, (int, float)) for v in color_val[:3]):
-                    hex_color = lottie_rgb_to_hex(color_val[:3])
-                    color_key = f"stroke:{hex_color}"
-                    if color_key not in seen_colors:
-                        seen_colors.add(color_key)
-                        results.append({
-                            "name": f"{layer_name} / {shape_name}",
-                            "path": f"{shape_path}.c.k",
-                            "current_value": hex_color,
-                            "type": "stroke"
-                        })
-
-        # Group (gr) - recurse into items
-        elif shape_type == "gr":
-            items = shape.get("it", [])
-            _find_colors_in_shapes(items, f"{shape_path}.it", layer_name, results, seen_colors)
+    """Find colors in shape layers, descending into groups in order."""
+    _isinstance, number_types = isinstance, (int, float)
+    add_result = results.append
+    stack = [(path_prefix, iter(enumerate(shapes)))]
+
+    while stack:
+        prefix, items = stack[-1]
+        for i, shape in items:
+            shape_get = shape.get
+            shape_type = shape_get("ty", "")
+
+            # Fill (fl) / Stroke (st)
+            color_type = _SHAPE_COLOR_TYPES.get(shape_type)
+            if color_type is not None:
+                color_val = shape_get("c", {}).get("k", [])
+                if _isinstance(color_val, list) and len(color_val) >= 3:
+                    # Check if it's static color (not animated)
+                    rgb = color_val[:3]
+                    if all(_isinstance(v, number_types) for v in rgb):
+                        hex_color = lottie_rgb_to_hex(rgb)
+                        color_key = (color_type, hex_color)
+                        if color_key not in seen_colors:
+                            seen_colors.add(color_key)
+                            shape_name = shape_get("nm", f"Shape {i}")
+                            add_result({
+                                "name": f"{layer_name} / {shape_name}",
+                                "path": f"{prefix}[{i}].c.k",
+                                "current_value": hex_color,
+                                "type": color_type
+                            })
+
+            # Group (gr) - descend into items, then resume this level
+            elif shape_type == "gr":
+                stack.append((f"{prefix}[{i}].it", iter(enumerate(shape_get("it", [])))))
+                break
+        else:
+            stack.pop()
 
 
 def generate_schema(path: str | Path, template_name: str = None) -> dict:
@@ -720,8 +1159,7 @@ def load_schema(template_path: str | Path) -> dict | None:
     if not schema_path.exists():
         return None
 
-    with open(schema_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _json_loads(schema_path.read_bytes())
 
 
 def save_schema(schema: dict, template_path: str | Path) -> Path:
@@ -738,8 +1176,7 @@ def save_schema(schema: dict, template_path: str | Path) -> Path:
     template_path = Path(template_path)
     schema_path = template_path.with_suffix(".schema.json")
 
-    with open(schema_path, "w", encoding="utf-8") as f:
-        json.dump(schema, f, indent=2)
+    schema_path.write_bytes(_json_dumps(schema, indent=True))
 
     return schema_path
 
@@ -785,31 +1222,50 @@ def render_template(
             f"Create {template_path.with_suffix('.schema.json')} first."
         )
 
-    # Load template
-    data = load_lottie(template_path)
-
-    # Apply field values
-    for field_name, value in field_values.items():
-        if field_name not in schema["fields"]:
-            available = list(schema["fields"].keys())
+    # Check field names before doing any work
+    fields = schema["fields"]
+    for field_name in field_values:
+        if field_name not in fields:
+            available = list(fields.keys())
             raise ValueError(
                 f"Unknown field '{field_name}'. Available fields: {available}"
             )
 
-        field_def = schema["fields"][field_name]
+    # Load template
+    data = load_lottie(template_path)
+
+    # Apply field values. Fields often share a parent node (e.g. several
+    # properties of one shape), so each parent is resolved only once.
+    containers = {}
+    rgb_cache = {}
+    for field_name, value in field_values.items():
+        field_def = fields[field_name]
         field_path = field_def["path"]
         field_type = field_def["type"]
 
+        parts = _parse_path(field_path)
+        parent_key, final_key = parts[:-1], parts[-1]
+        container = containers.get(parent_key)
+        if container is None:
+            container = containers[parent_key] = _compile_path(field_path)[2](data)
+
         if field_type == "text":
-            _set_value_at_path(data, field_path, value)
+            container[final_key] = value
         elif field_type == "color":
             # Convert hex to Lottie RGB
-            rgb = hex_to_lottie_rgb(value)
+            if value not in rgb_cache:
+                rgb_cache[value] = hex_to_lottie_rgb(value)
+            rgb = list(rgb_cache[value])
             # Add alpha if needed
-            current = _get_value_at_path(data, field_path)
+            current = container[final_key]
             if isinstance(current, list) and len(current) == 4:
                 rgb.append(current[3])  # Preserve alpha
-            _set_value_at_path(data, field_path, rgb)
+            container[final_key] = rgb
+
+        # A value replaced above may itself be a cached parent of another field
+        stale = [key for key in containers if key[:len(parts)] == parts]
+        for key in stale:
+            del containers[key]
 
     # Save if output path provided
     if output_path:
@@ -818,43 +1274,49 @@ def render_template(
     return data
 
 
-def _get_value_at_path(data: dict, path: str) -> Any:
-    """Get a value from nested dict/list using path notation."""
-    current = data
+@lru_cache(maxsize=1024)
+def _parse_path(path: str) -> tuple[int | str, ...]:
+    """Split a path like "layers[0].shapes[1].c.k" into dict keys / list indices."""
+    parts = (part.rstrip(']') for part in _PATH_SPLIT_RE.split(path))
+    return tuple(int(part) if part.isdigit() else part for part in parts if part)
 
-    # Parse path like "layers[0].shapes[1].c.k"
-    parts = re.split(r'\.|\[', path)
 
-    for part in parts:
-        part = part.rstrip(']')
-        if not part:
-            continue
+@lru_cache(maxsize=1024)
+def _compile_path(path: str) -> tuple[Callable, Callable, Callable]:
+    """
+    Build (getter, setter, parent_getter) functions for a schema path.
 
-        if part.isdigit():
-            current = current[int(part)]
-        else:
-            current = current[part]
+    The path is parsed once into its key tuple; the returned closures just
+    walk that tuple, so repeated renders of a template do no parsing.
+    """
+    parts = _parse_path(path)
+    if not parts:
+        raise ValueError(f"Invalid field path: {path!r}")
 
-    return current
+    parent_keys, final_key = parts[:-1], parts[-1]
 
+    def get_parent(d):
+        for key in parent_keys:
+            d = d[key]
+        return d
 
-def _set_value_at_path(data: dict, path: str, value: Any) -> None:
-    """Set a value in nested dict/list using path notation."""
-    parts = re.split(r'\.|\[', path)
-    parts = [p.rstrip(']') for p in parts if p]
+    def get_value(d):
+        return get_parent(d)[final_key]
 
-    current = data
-    for part in parts[:-1]:
-        if part.isdigit():
-            current = current[int(part)]
-        else:
-            current = current[part]
+    def set_value(d, value):
+        get_parent(d)[final_key] = value
+
+    return get_value, set_value, get_parent
+
+
+def _get_value_at_path(data: dict, path: str) -> Any:
+    """Get a value from nested dict/list using path notation."""
+    return _compile_path(path)[0](data)
 
-    final_key = parts[-1]
-    if final_key.isdigit():
-        current[int(final_key)] = value
-    else:
-        current[final_key] = value
+
+def _set_value_at_path(data: dict, path: str, value: Any) -> None:
+    """Set a value in nested dict/list using path notation."""
+    _compile_path(path)[1](data, value)
 
 
 def list_templates(
@@ -869,28 +1331,55 @@ def list_templates(
     Returns:
         List of template info dictionaries
     """
-    lottie_dir = Path(lottie_dir)
     templates = []
 
-    for json_file in lottie_dir.rglob("*.json"):
-        # Skip catalog, schema, and meta files
-        if json_file.name in ("catalog.json",):
-            continue
-        if ".schema." in json_file.name or ".meta." in json_file.name:
-            continue
-
-        schema_path = json_file.with_suffix(".schema.json")
-        schema = load_schema(json_file) if schema_path.exists() else None
-
-        rel_path = json_file.relative_to(lottie_dir)
+    for rel_dir, name, schema_path in _iter_template_files(str(lottie_dir)):
+        # The directory listing already says whether a schema exists, so
+        # load_schema is only called for templates that have one
+        schema = load_schema(os.path.join(lottie_dir, rel_dir, name)) if schema_path else None
 
         templates.append({
-            "path": str(rel_path),
-            "category": rel_path.parent.name if rel_path.parent.name != "." else "root",
-            "name": schema["name"] if schema else json_file.stem,
+            "path": os.path.join(rel_dir, name),
+            "category": os.path.basename(rel_dir) or "root",
+            "name": schema["name"] if schema else name[:-len(".json")],
             "has_schema": schema is not None,
             "fields": list(schema["fields"].keys()) if schema else [],
             "description": schema.get("description", "") if schema else ""
         })
 
     return templates
+
+
+def _iter_template_files(root: str):
+    """
+    Yield (relative_dir, file_name, schema_path_or_None) for template files.
+
+    Walks the tree with os.scandir (directories in the same pre-order as
+    Path.rglob) and skips catalog, schema and meta files. Schema existence
+    comes from the directory listing itself, so no per-file stat is needed.
+    """
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        abs_dir = os.path.join(root, rel_dir)
+
+        names = set()
+        json_names = []
+        subdirs = []
+        with os.scandir(abs_dir) as entries:
+            for entry in entries:
+                names.add(entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(os.path.join(rel_dir, entry.name))
+                elif entry.name.endswith(".json"):
+                    json_names.append(entry.name)
+
+        for name in json_names:
+            # Skip catalog, schema, and meta files
+            if name == "catalog.json" or ".schema." in name or ".meta." in name:
+                continue
+            schema_name = name[:-len(".json")] + ".schema.json"
+            schema_path = os.path.join(abs_dir, schema_name) if schema_name in names else None
+            yield rel_dir, name, schema_path
+
+        stack.extend(reversed(subdirs))
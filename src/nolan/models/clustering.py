@@ -1,13 +1,14 @@
 """Clustering-related data models."""
 
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import List, Optional, Dict, Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from nolan.models.video import VideoSegment
 
 
-@dataclass
+@dataclass(slots=True)
 class SceneCluster:
     """A cluster of continuous video segments representing a story moment."""
 
@@ -37,36 +38,26 @@ class SceneCluster:
     @property
     def timestamp_formatted(self) -> str:
         """Format timestamp as MM:SS - MM:SS."""
-        start_min = int(self.timestamp_start // 60)
-        start_sec = int(self.timestamp_start % 60)
-        end_min = int(self.timestamp_end // 60)
-        end_sec = int(self.timestamp_end % 60)
-        return f"{start_min:02d}:{start_sec:02d} - {end_min:02d}:{end_sec:02d}"
+        return _format_range(self.timestamp_start, self.timestamp_end)
 
     @property
     def people(self) -> List[str]:
         """Unique people across all segments."""
-        people_set = set()
-        for seg in self.segments:
-            if seg.inferred_context and seg.inferred_context.people:
-                people_set.update(seg.inferred_context.people)
-        return sorted(people_set)
+        contexts = (seg.inferred_context for seg in self.segments)
+        return sorted(set(chain.from_iterable(
+            ctx.people for ctx in contexts if ctx and ctx.people
+        )))
 
     @property
     def locations(self) -> List[str]:
         """Unique locations across all segments."""
-        locations = set()
-        for seg in self.segments:
-            if seg.inferred_context and seg.inferred_context.location:
-                loc = seg.inferred_context.location
-                # Handle location as list or string
-                if isinstance(loc, list):
-                    for item in loc:
-                        if item:
-                            locations.add(str(item))
-                elif loc:
-                    locations.add(str(loc))
-        return sorted(locations)
+        contexts = (seg.inferred_context for seg in self.segments)
+        # Handle location as list or string
+        items = chain.from_iterable(
+            ctx.location if isinstance(ctx.location, list) else (ctx.location,)
+            for ctx in contexts if ctx and ctx.location
+        )
+        return sorted({str(item) for item in items if item})
 
     @property
     def combined_transcript(self) -> str:
@@ -79,12 +70,15 @@ class SceneCluster:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON export."""
+        # Derived values are recomputed on every property access (segments is
+        # mutable, so nothing is cached); read each one once here
+        start, end = self.timestamp_start, self.timestamp_end
         return {
             "id": self.id,
-            "timestamp_start": self.timestamp_start,
-            "timestamp_end": self.timestamp_end,
-            "timestamp_formatted": self.timestamp_formatted,
-            "duration": self.duration,
+            "timestamp_start": start,
+            "timestamp_end": end,
+            "timestamp_formatted": _format_range(start, end),
+            "duration": end - start,
             "segment_count": len(self.segments),
             "cluster_summary": self.cluster_summary,
             "people": self.people,
@@ -101,3 +95,12 @@ class SceneCluster:
                 for s in self.segments
             ]
         }
+
+
+def _format_range(start: float, end: float) -> str:
+    """Format a start/end pair in seconds as MM:SS - MM:SS."""
+    start_min = int(start // 60)
+    start_sec = int(start % 60)
+    end_min = int(end // 60)
+    end_sec = int(end % 60)
+    return f"{start_min:02d}:{start_sec:02d} - {end_min:02d}:{end_sec:02d}"
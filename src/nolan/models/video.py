@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class InferredContext:
     """Inferred context from visual + audio analysis."""
     people: List[str] = field(default_factory=list)
@@ -37,7 +37,7 @@ class InferredContext:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoSegment:
     """A segment of indexed video with hybrid data."""
     video_path: str
@@ -4,8 +4,13 @@ import re
 from dataclasses import dataclass
 from typing import List
 
+# Level-2 markdown header line ("## Title"). Multiline mode so one split call
+# finds every header; the whitespace class excludes newlines so a header
+# never spans lines.
+_HEADER_RE = re.compile(r'^##[^\S\n]+(.+?)$', re.MULTILINE)
 
-@dataclass
+
+@dataclass(slots=True)
 class Section:
     """A section of the essay."""
     title: str
@@ -27,41 +32,17 @@ def parse_essay(text: str) -> List[Section]:
     Returns:
         List of Section objects.
     """
-    # Split on ## headers (level 2)
-    pattern = r'^##\s+(.+?)$'
+    # Split on ## headers (level 2): [preamble, title1, body1, title2, body2, ...]
+    # The preamble before the first header is not part of any section.
+    parts = _HEADER_RE.split(text)
 
     sections = []
-    current_title = None
-    current_content = []
-
-    for line in text.split('\n'):
-        header_match = re.match(pattern, line)
-
-        if header_match:
-            # Save previous section if exists
-            if current_title is not None:
-                content = '\n'.join(current_content).strip()
-                word_count = len(content.split())
-                sections.append(Section(
-                    title=current_title,
-                    content=content,
-                    word_count=word_count
-                ))
-
-            # Start new section
-            current_title = header_match.group(1).strip()
-            current_content = []
-        else:
-            current_content.append(line)
-
-    # Don't forget the last section
-    if current_title is not None:
-        content = '\n'.join(current_content).strip()
-        word_count = len(content.split())
+    for title, body in zip(parts[1::2], parts[2::2]):
+        content = body.strip()
         sections.append(Section(
-            title=current_title,
+            title=title.strip(),
             content=content,
-            word_count=word_count
+            word_count=len(content.split())
         ))
 
     return sections
@@ -5,6 +5,7 @@ Renders expected text using a known-good method and compares against
 the video frame to detect text rendering issues without requiring OCR.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Dict, Any, List, Optional
 import subprocess
@@ -13,6 +14,11 @@ import os
 
 from ..types import QAIssue, IssueType, IssueSeverity
 
+# Both images are compared as grayscale at this small (width, height);
+# the downsample uses Image.BOX (area averaging), which is both cheaper than
+# the default bicubic kernel and a better anti-alias at ~10x reduction
+_COMPARE_SIZE = (200, 100)
+
 
 def create_reference_text_image(
     text: str,
@@ -28,38 +34,141 @@ def create_reference_text_image(
     Returns PNG bytes.
     """
     try:
-        from PIL import Image, ImageDraw, ImageFont
-        import io
+        return _render_ref(
+            text, width, height, font_path, font_size, tuple(bg_color), text_color
+        )
+    except ImportError:
+        return None
+    except Exception:
+        return None
 
-        img = Image.new('RGB', (width, height), bg_color)
-        draw = ImageDraw.Draw(img)
 
-        # Load font
-        try:
-            font = ImageFont.truetype(font_path, font_size)
-        except OSError:
-            # Fallback to default font
-            font = ImageFont.load_default()
+def _reference_text_array(
+    text: str,
+    width: int = 1920,
+    height: int = 1080,
+    font_path: str = "C:/Windows/Fonts/arialbd.ttf",
+    font_size: int = 80,
+    bg_color: Tuple[int, int, int] = (26, 26, 26),
+    text_color: str = "white",
+):
+    """
+    Like create_reference_text_image, but returns the grayscale comparison
+    array (see _comparison_array) instead of PNG bytes, or None on error.
+    """
+    try:
+        return _render_ref_array(
+            text, width, height, font_path, font_size, tuple(bg_color), text_color
+        )
+    except Exception:
+        return None
 
-        # Get text size and center it
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        x = (width - text_width) // 2
-        y = (height - text_height) // 2
 
-        # Draw text
-        draw.text((x, y), text, fill=text_color, font=font)
+@lru_cache(maxsize=32)
+def _render_ref(
+    text: str,
+    width: int,
+    height: int,
+    font_path: str,
+    font_size: int,
+    bg_color: Tuple[int, int, int],
+    text_color: str,
+) -> bytes:
+    """
+    Render the reference text image as PNG bytes.
 
-        # Convert to bytes
-        buffer = io.BytesIO()
-        img.save(buffer, format='PNG')
-        return buffer.getvalue()
+    Pure in its arguments, so it's memoized: the fix/retry loop validates
+    the same expected text repeatedly and only pays for font loading,
+    rasterization and PNG encoding once. Errors propagate (and aren't
+    cached); create_reference_text_image turns them into None.
+    """
+    import io
 
-    except ImportError:
-        return None
-    except Exception:
-        return None
+    img = _draw_ref(text, width, height, font_path, font_size, bg_color, text_color)
+
+    # Convert to bytes
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=32)
+def _render_ref_array(
+    text: str,
+    width: int,
+    height: int,
+    font_path: str,
+    font_size: int,
+    bg_color: Tuple[int, int, int],
+    text_color: str,
+):
+    """
+    Render the reference text image straight to a comparison array.
+
+    Same pixels as decoding create_reference_text_image's PNG and passing
+    it through _comparison_array, minus the PNG encode/decode round-trip.
+    The cached array is read-only since it's shared between calls.
+    """
+    import numpy as np
+    from PIL import Image
+
+    img = _draw_ref(text, width, height, font_path, font_size, bg_color, text_color)
+    pixels = np.array(img.convert('L').resize(_COMPARE_SIZE, Image.BOX), dtype=np.float64)
+    pixels.setflags(write=False)
+    return pixels
+
+
+def _draw_ref(
+    text: str,
+    width: int,
+    height: int,
+    font_path: str,
+    font_size: int,
+    bg_color: Tuple[int, int, int],
+    text_color: str,
+):
+    """Draw the expected text centered on a plain canvas; returns a PIL image."""
+    from PIL import Image, ImageDraw, ImageFont
+
+    img = Image.new('RGB', (width, height), bg_color)
+    draw = ImageDraw.Draw(img)
+
+    # Load font
+    try:
+        font = ImageFont.truetype(font_path, font_size)
+    except OSError:
+        # Fallback to default font
+        font = ImageFont.load_default()
+
+    # Get text size and center it
+    bbox = draw.textbbox((0, 0), text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    x = (width - text_width) // 2
+    y = (height - text_height) // 2
+
+    # Draw text
+    draw.text((x, y), text, fill=text_color, font=font)
+    return img
+
+
+def _comparison_array(image):
+    """
+    Grayscale float64 array at _COMPARE_SIZE for an encoded image.
+
+    Arrays already produced by this function (or _render_ref_array) are
+    passed through unchanged.
+    """
+    import numpy as np
+
+    if isinstance(image, np.ndarray):
+        return image
+
+    from PIL import Image
+    import io
+
+    img = Image.open(io.BytesIO(image)).convert('L')
+    return np.array(img.resize(_COMPARE_SIZE, Image.BOX), dtype=np.float64)
 
 
 def extract_text_region(
@@ -94,39 +203,33 @@ def extract_text_region(
 
 
 def calculate_structural_similarity(
-    img1_bytes: bytes,
-    img2_bytes: bytes,
+    img1_bytes,
+    img2_bytes,
 ) -> float:
     """
     Calculate structural similarity between two images.
+    Accepts encoded image bytes or arrays from _comparison_array.
     Returns value between 0 (different) and 1 (identical).
     """
     try:
-        from PIL import Image
-        import io
-
-        img1 = Image.open(io.BytesIO(img1_bytes)).convert('L')  # Grayscale
-        img2 = Image.open(io.BytesIO(img2_bytes)).convert('L')
-
-        # Resize to same size for comparison
-        size = (200, 100)  # Small size for fast comparison
-        img1 = img1.resize(size)
-        img2 = img2.resize(size)
+        import numpy as np
 
-        # Get pixel data
-        pixels1 = list(img1.getdata())
-        pixels2 = list(img2.getdata())
+        # Grayscale at a small fixed size for fast comparison, as flat
+        # float64 vectors (copies, so the in-place centering below never
+        # touches the caller's arrays)
+        pixels1 = np.array(_comparison_array(img1_bytes), dtype=np.float64).ravel()
+        pixels2 = np.array(_comparison_array(img2_bytes), dtype=np.float64).ravel()
 
-        if len(pixels1) != len(pixels2):
+        if pixels1.size != pixels2.size:
             return 0.0
 
         # Calculate normalized cross-correlation
-        mean1 = sum(pixels1) / len(pixels1)
-        mean2 = sum(pixels2) / len(pixels2)
+        pixels1 -= pixels1.mean()
+        pixels2 -= pixels2.mean()
 
-        numerator = sum((p1 - mean1) * (p2 - mean2) for p1, p2 in zip(pixels1, pixels2))
-        denom1 = sum((p1 - mean1) ** 2 for p1 in pixels1) ** 0.5
-        denom2 = sum((p2 - mean2) ** 2 for p2 in pixels2) ** 0.5
+        numerator = float(pixels1 @ pixels2)
+        denom1 = float(np.sqrt(pixels1 @ pixels1))
+        denom2 = float(np.sqrt(pixels2 @ pixels2))
 
         if denom1 == 0 or denom2 == 0:
             return 0.0
@@ -174,14 +277,15 @@ def check_text_rendering(
             duration = float(result.stdout.strip())
             timestamp = duration * 0.5  # Middle frame
 
-        # Extract frame from video
+        # Extract frame from video (uncompressed BMP: it is decoded right
+        # back for comparison, so PNG compression would be wasted work)
         cmd = [
             ffmpeg_path,
             "-ss", str(timestamp),
             "-i", str(video_path),
             "-vframes", "1",
             "-f", "image2pipe",
-            "-vcodec", "png",
+            "-vcodec", "bmp",
             "-"
         ]
         result = subprocess.run(cmd, capture_output=True)
@@ -190,12 +294,13 @@ def check_text_rendering(
             metadata["visual_text_check"]["error"] = "Failed to extract frame"
             return issues, metadata
 
-        video_frame = result.stdout
+        video_frame = _comparison_array(result.stdout)
         metadata["visual_text_check"]["frame_extracted"] = True
 
-        # Create reference image with expected text
-        reference = create_reference_text_image(expected_text)
-        if not reference:
+        # Create reference image with expected text (as a comparison array,
+        # skipping the PNG encode create_reference_text_image would do)
+        reference = _reference_text_array(expected_text)
+        if reference is None:
             metadata["visual_text_check"]["error"] = "Failed to create reference"
             return issues, metadata
 
@@ -6,6 +6,7 @@ This module provides automated quality assurance for rendered video content.
 
 import subprocess
 import json
+import logging
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 import tempfile
@@ -16,6 +17,15 @@ from .types import (
     IssueType, IssueSeverity
 )
 
+logger = logging.getLogger(__name__)
+
+# Blank-frame detection only needs the average brightness, so sample frames
+# are area-downscaled by ffmpeg to at most this width before they're piped out
+_BRIGHTNESS_SAMPLE_WIDTH = 240
+
+# Most video files whose ffprobe results a QualityProtocol keeps around
+_PROPS_CACHE_SIZE = 32
+
 
 class QualityProtocol:
     """
@@ -37,6 +47,10 @@ class QualityProtocol:
         self.config = config or QAConfig()
         self._ffprobe_path = "ffprobe"
         self._ffmpeg_path = "ffmpeg"
+        # ffprobe results per path, tagged with the (mtime_ns, size) they were
+        # probed at; validate() needs them in several checks and fix()
+        # re-validates the same outputs. Oldest paths are evicted first.
+        self._props_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
     def validate(
         self,
@@ -200,10 +214,10 @@ class QualityProtocol:
                 return issues, metadata
 
             # Extract and check frames at sample points
-            for sample_point in self.config.frame_sample_points:
-                timestamp = duration * sample_point
-                frame_data = self._extract_frame(video_path, timestamp)
+            timestamps = [duration * sample_point for sample_point in self.config.frame_sample_points]
+            frames = self._extract_frames(video_path, timestamps, scale_width=_BRIGHTNESS_SAMPLE_WIDTH)
 
+            for timestamp, frame_data in zip(timestamps, frames):
                 if frame_data:
                     is_blank, brightness = self._analyze_frame(frame_data)
                     metadata["frames_checked"].append({
@@ -310,7 +324,28 @@ class QualityProtocol:
         return issues, metadata
 
     def _get_video_properties(self, video_path: Path) -> Dict[str, Any]:
-        """Get video properties using ffprobe."""
+        """Get video properties using ffprobe (cached until the file changes)."""
+        try:
+            stat = video_path.stat()
+        except OSError:
+            return self._probe_video_properties(video_path)  # reports the ffprobe error
+
+        path_key = str(video_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._props_cache.pop(path_key, None)
+        if cached is not None and cached[0] == version:
+            props = cached[1]
+        else:
+            props = self._probe_video_properties(video_path)
+
+        # Re-insert so the dict stays ordered oldest-use first
+        self._props_cache[path_key] = (version, props)
+        if len(self._props_cache) > _PROPS_CACHE_SIZE:
+            del self._props_cache[next(iter(self._props_cache))]
+        return dict(props)
+
+    def _probe_video_properties(self, video_path: Path) -> Dict[str, Any]:
+        """Run ffprobe and parse the first video stream's properties."""
         cmd = [
             self._ffprobe_path,
             "-v", "error",
@@ -348,15 +383,26 @@ class QualityProtocol:
             "fps": fps
         }
 
-    def _extract_frame(self, video_path: Path, timestamp: float) -> Optional[bytes]:
-        """Extract a frame as raw bytes."""
+    def _extract_frame(
+        self,
+        video_path: Path,
+        timestamp: float,
+        scale_width: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Extract a frame as raw bytes (uncompressed BMP), optionally downscaled."""
+        # BMP rather than PNG: the frame is decoded straight back by PIL, so
+        # a deflate/inflate round-trip per frame would be pure overhead
         cmd = [
             self._ffmpeg_path,
             "-ss", str(timestamp),
             "-i", str(video_path),
             "-vframes", "1",
+        ]
+        if scale_width:
+            cmd += ["-vf", _scale_filter(scale_width)]
+        cmd += [
             "-f", "image2pipe",
-            "-vcodec", "png",
+            "-vcodec", "bmp",
             "-"
         ]
 
@@ -366,6 +412,55 @@ class QualityProtocol:
             return result.stdout
         return None
 
+    def _extract_frames(
+        self,
+        video_path: Path,
+        timestamps: List[float],
+        scale_width: Optional[int] = None
+    ) -> List[Optional[bytes]]:
+        """
+        Extract one frame per timestamp (as BMP bytes) in a single ffmpeg run.
+
+        Each timestamp is opened as its own input with a fast input seek,
+        trimmed to one frame and concatenated in order, so the frames come
+        back from one process without decoding the whole video. If the
+        stream doesn't yield exactly one frame per timestamp (e.g. a seek
+        past the end), falls back to extracting them one at a time.
+        """
+        if len(timestamps) <= 1:
+            return [self._extract_frame(video_path, t, scale_width) for t in timestamps]
+
+        cmd = [self._ffmpeg_path]
+        for t in timestamps:
+            cmd += ["-ss", str(t), "-i", str(video_path)]
+        scale = f",{_scale_filter(scale_width)}" if scale_width else ""
+        chains = "".join(f"[{i}:v:0]trim=end_frame=1{scale}[f{i}];" for i in range(len(timestamps)))
+        inputs = "".join(f"[f{i}]" for i in range(len(timestamps)))
+        cmd += [
+            "-filter_complex", f"{chains}{inputs}concat=n={len(timestamps)}:v=1:a=0[out]",
+            "-map", "[out]",
+            "-vsync", "0",
+            "-f", "image2pipe",
+            "-vcodec", "bmp",
+            "-"
+        ]
+
+        result = subprocess.run(cmd, capture_output=True)
+        if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", "replace").strip()
+            reason = f"ffmpeg exited with {result.returncode}: {stderr[-500:]}"
+        else:
+            frames = _split_bmp_stream(result.stdout)
+            if len(frames) == len(timestamps):
+                return frames
+            reason = f"got {len(frames)} frames for {len(timestamps)} timestamps"
+
+        logger.warning(
+            "batched frame extraction from %s failed (%s); extracting one at a time",
+            video_path, reason,
+        )
+        return [self._extract_frame(video_path, t, scale_width) for t in timestamps]
+
     def _extract_frame_to_file(self, video_path: Path, timestamp: float) -> Optional[str]:
         """Extract a frame to a temp file and return path."""
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
@@ -393,15 +488,16 @@ class QualityProtocol:
         """
         try:
             from PIL import Image
+            import numpy as np
             import io
 
             image = Image.open(io.BytesIO(frame_data))
             # Convert to grayscale
             gray = image.convert("L")
 
-            # Calculate average brightness
-            pixels = list(gray.getdata())
-            avg_brightness = sum(pixels) / len(pixels) if pixels else 0
+            # Calculate average brightness (vectorized over the pixel buffer)
+            pixels = np.asarray(gray, dtype=np.uint8)
+            avg_brightness = float(pixels.mean()) if pixels.size else 0
 
             # Normalize to 0-1
             brightness_ratio = avg_brightness / 255.0
@@ -483,3 +579,22 @@ class QualityProtocol:
 
         print("[QA] All fix attempts exhausted")
         return None
+
+
+def _split_bmp_stream(data: bytes) -> List[bytes]:
+    """Split concatenated BMP images (ffmpeg image2pipe output) into frames."""
+    frames = []
+    pos = 0
+    while pos + 6 <= len(data) and data[pos:pos + 2] == b"BM":
+        # BITMAPFILEHEADER: "BM" then the total file size as a little-endian uint32
+        size = int.from_bytes(data[pos + 2:pos + 6], "little")
+        if size <= 0 or pos + size > len(data):
+            break
+        frames.append(data[pos:pos + size])
+        pos += size
+    return frames
+
+
+def _scale_filter(max_width: int) -> str:
+    """ffmpeg filter: area-average down to max_width (never upscale), keep aspect."""
+    return f"scale=w='min({max_width},iw)':h=-2:flags=area"
@@ -10,6 +10,8 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Optional, Literal
 
+from nolan.lottie import load_lottie_metadata
+
 
 @dataclass
 class TemplateInfo:
@@ -158,15 +160,14 @@ class TemplateCatalog:
 
             # Try to get info from the file
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = load_lottie_metadata(json_file)
                 width = int(data.get("w", 0))
                 height = int(data.get("h", 0))
                 fps = float(data.get("fr", 30))
                 ip = data.get("ip", 0)
                 op = data.get("op", 0)
                 duration = (op - ip) / fps if fps > 0 else 0
-            except (json.JSONDecodeError, KeyError):
+            except (ValueError, KeyError):
                 width, height, fps, duration = 0, 0, 30.0, 0.0
 
             template_id = f"{source}-{json_file.stem}"
@@ -142,6 +142,20 @@ class TestSaveLottieJson:
         # Pretty printed should have newlines or indentation
         assert '  ' in content or '\n' in content
 
+    def test_stdlib_fallback(self, tmp_path, monkeypatch):
+        """Output parses identically when orjson is not installed."""
+        import nolan.lottie as lottie_mod
+        data = {'w': 100, 'h': 100, 'nm': 'caf\u00e9', 'layers': [{'ks': [0.5, 1]}]}
+
+        fast = save_lottie_json(data, tmp_path / 'fast.json', minify=False)
+        monkeypatch.setattr(lottie_mod, 'orjson', None)
+        slow = save_lottie_json(data, tmp_path / 'slow.json', minify=False)
+
+        assert json.loads((tmp_path / 'slow.json').read_bytes()) == data
+        assert json.loads((tmp_path / 'fast.json').read_bytes()) == data
+        assert slow == (tmp_path / 'slow.json').stat().st_size
+        assert fast == (tmp_path / 'fast.json').stat().st_size
+
 
 class TestRateLimiter:
     """Tests for RateLimiter utility."""
@@ -171,6 +185,23 @@ class TestRateLimiter:
         # Should wait approximately the interval
         assert elapsed >= 0.08
 
+    def test_shared_across_threads(self):
+        """Concurrent callers are spaced out, not released together."""
+        import threading
+        import time
+        limiter = RateLimiter(requests_per_minute=600)  # 0.1s interval
+
+        start = time.monotonic()
+        workers = [threading.Thread(target=limiter.wait) for _ in range(3)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        elapsed = time.monotonic() - start
+
+        # First slot is immediate, the next two follow at 0.1s intervals
+        assert elapsed >= 0.18
+
 
 class TestCatalogBuilder:
     """Tests for CatalogBuilder utility."""
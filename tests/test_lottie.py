@@ -5,6 +5,9 @@ from pathlib import Path
 import tempfile
 import shutil
 import json
+import os
+import subprocess
+import sys
 
 from nolan.lottie import (
     # Color utilities
@@ -13,11 +16,14 @@ from nolan.lottie import (
     # Lottie file operations
     validate_lottie,
     load_lottie,
+    load_lottie_metadata,
     save_lottie,
     get_lottie_info,
+    quick_validate,
     # Text and color operations
     get_text_layers,
     replace_text,
+    replace_texts,
     transform_colors,
     # Timing and dimensions
     set_duration,
@@ -25,7 +31,9 @@ from nolan.lottie import (
     set_dimensions,
     # Main customization API
     customize_lottie,
+    customize_lottie_batch,
     # Color transforms
+    cyberpunk_transform,
     noir_transform,
     invert_transform,
     # Schema system
@@ -332,6 +340,33 @@ class TestValidation:
         assert is_valid is False
         assert "w" in error
 
+    def test_validate_numpy_numbers(self, sample_lottie):
+        """NumPy scalars count as numbers, like on the save path."""
+        np = pytest.importorskip("numpy")
+        sample_lottie["fr"] = np.float64(29.97)
+        sample_lottie["w"] = np.int64(1920)
+        assert validate_lottie(sample_lottie) == (True, None)
+
+    def test_validate_bool_is_not_a_number(self, sample_lottie):
+        """True is an int subclass but not a valid dimension."""
+        sample_lottie["h"] = True
+        is_valid, error = validate_lottie(sample_lottie)
+        assert is_valid is False
+        assert "h" in error
+
+    def test_validate_non_object_root(self):
+        """Valid JSON that isn't an object fails validation instead of raising."""
+        is_valid, error = validate_lottie([{"fr": 30}])
+        assert is_valid is False
+        assert "object" in error
+
+    def test_load_non_object_root(self, tmp_path):
+        """load_lottie raises ValueError for a top-level JSON array."""
+        path = tmp_path / "array.json"
+        path.write_text("[1, 2, 3]")
+        with pytest.raises(ValueError, match="Invalid Lottie file"):
+            load_lottie(path)
+
 
 # =============================================================================
 # File Operations Tests
@@ -355,6 +390,56 @@ class TestFileOperations:
         finally:
             Path(temp_path).unlink()
 
+    def test_load_and_save_stdlib_fallback(self, sample_lottie, tmp_path, monkeypatch):
+        """Round-trip still works when orjson is not installed."""
+        import nolan.lottie as lottie_mod
+        monkeypatch.setattr(lottie_mod, "orjson", None)
+
+        path = tmp_path / "anim.json"
+        save_lottie(sample_lottie, path)
+        assert path.read_text(encoding="utf-8") == json.dumps(
+            sample_lottie, separators=(',', ':')
+        )
+        assert load_lottie(path) == sample_lottie
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_numpy_values(self, sample_lottie, tmp_path, monkeypatch, use_orjson):
+        """NumPy arrays and scalars inside the data are saved as plain JSON."""
+        np = pytest.importorskip("numpy")
+        import nolan.lottie as lottie_mod
+        if not use_orjson:
+            monkeypatch.setattr(lottie_mod, "orjson", None)
+        elif lottie_mod.orjson is None:
+            pytest.skip("orjson not installed")
+
+        sample_lottie["layers"] = [{"ty": 4, "ks": {"p": {"k": np.array([1.5, 2.0, 0.0])}}}]
+        sample_lottie["op"] = np.int64(120)
+
+        path = tmp_path / "anim.json"
+        save_lottie(sample_lottie, path)
+        loaded = load_lottie(path)
+        assert loaded["layers"][0]["ks"]["p"]["k"] == [1.5, 2.0, 0.0]
+        assert loaded["op"] == 120
+
+    def test_quick_validate(self, sample_lottie, tmp_path):
+        """quick_validate accepts Lottie files and rejects other JSON without parsing."""
+        lottie_path = tmp_path / "anim.json"
+        save_lottie(sample_lottie, lottie_path)
+        assert quick_validate(lottie_path) is True
+
+        # Required keys placed after a large asset list are still found
+        sample_lottie = {"assets": [{"id": "x" * 40000}], **sample_lottie}
+        save_lottie(sample_lottie, lottie_path)
+        assert quick_validate(lottie_path) is True
+
+        other = tmp_path / "other.json"
+        other.write_text(json.dumps({"name": "schema", "fields": {}}))
+        assert quick_validate(other) is False
+
+        array = tmp_path / "array.json"
+        array.write_text("[1, 2, 3]")
+        assert quick_validate(array) is False
+
     def test_load_nonexistent_raises(self):
         """Loading non-existent file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
@@ -377,6 +462,59 @@ class TestFileOperations:
         finally:
             Path(temp_path).unlink()
 
+    def test_get_lottie_info_sees_file_changes(self, sample_lottie, tmp_path):
+        """Repeated info reads pick up edits to the file."""
+        path = tmp_path / "anim.json"
+        save_lottie(sample_lottie, path)
+        assert get_lottie_info(path)["out_point"] == 60
+
+        sample_lottie["op"] = 1200
+        save_lottie(sample_lottie, path)
+        assert get_lottie_info(path)["out_point"] == 1200
+
+    def test_get_lottie_info_result_is_not_shared(self, lottie_with_text, tmp_path):
+        """Mutating a returned info dict does not affect later calls."""
+        path = tmp_path / "anim.json"
+        save_lottie(lottie_with_text, path)
+
+        info = get_lottie_info(path)
+        info["fps"] = 0
+        info["text_layers"][0]["text"] = "changed"
+        info["text_layers"].clear()
+
+        again = get_lottie_info(path)
+        assert again["fps"] == 30
+        assert [t["text"] for t in again["text_layers"]] == ["Hello World", "Welcome"]
+
+    def test_load_lottie_metadata(self, lottie_with_text, tmp_path):
+        """load_lottie_metadata reads header fields and counts only."""
+        path = tmp_path / "anim.json"
+        save_lottie(lottie_with_text, path)
+
+        meta = load_lottie_metadata(path)
+
+        assert meta["fr"] == 30
+        assert meta["w"] == 1920
+        assert meta["nm"] == "Text Animation"
+        assert meta["layer_count"] == len(lottie_with_text["layers"])
+        assert meta["asset_count"] == 0
+
+    def test_load_lottie_metadata_invalid_json(self, tmp_path):
+        """Malformed JSON surfaces as ValueError."""
+        path = tmp_path / "broken.json"
+        path.write_text("{\"fr\": 30, ", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            load_lottie_metadata(path)
+
+    def test_load_lottie_metadata_non_object_root(self, tmp_path):
+        """A top-level array surfaces as ValueError, not AttributeError."""
+        path = tmp_path / "array.json"
+        path.write_text("[1, 2, 3]", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="JSON object"):
+            load_lottie_metadata(path)
+
 
 # =============================================================================
 # Text Operations Tests
@@ -408,6 +546,49 @@ class TestTextOperations:
         count = replace_text(lottie_with_text, "Nonexistent", "Replacement")
         assert count == 0
 
+    def test_replace_texts_single_pass(self, lottie_with_text):
+        """Multiple replacements are applied simultaneously in one pass."""
+        count = replace_texts(
+            lottie_with_text,
+            {"Hello World": "Welcome", "Welcome": "Goodbye"},
+        )
+
+        assert count == 2
+        texts = [t["text"] for t in get_text_layers(lottie_with_text)]
+        assert texts == ["Welcome", "Goodbye"]
+
+    def test_replace_texts_shared_precomp(self, lottie_with_text):
+        """Text in a precomp referenced by two layers is replaced only once."""
+        title = lottie_with_text["layers"][0]
+        title["t"]["d"]["k"][0]["s"]["t"] = "A"
+        lottie_with_text["layers"] = [
+            {"ty": 0, "nm": "First", "refId": "shared"},
+            {"ty": 0, "nm": "Second", "refId": "shared"},
+        ]
+        lottie_with_text["assets"] = [{"id": "shared", "layers": [title]}]
+
+        count = replace_texts(lottie_with_text, {"A": "B", "B": "C"})
+
+        assert count == 1
+        assert title["t"]["d"]["k"][0]["s"]["t"] == "B"
+
+    def test_get_text_layers_in_nested_precomps(self, lottie_with_text):
+        """Text inside precomps is found in walk order; cycles are not re-entered."""
+        title = lottie_with_text["layers"][0]
+        lottie_with_text["layers"] = [
+            {"ty": 0, "nm": "Outer", "refId": "outer"},
+            lottie_with_text["layers"][1],
+        ]
+        lottie_with_text["assets"] = [
+            {"id": "outer", "layers": [{"ty": 0, "refId": "inner"}]},
+            {"id": "inner", "layers": [title, {"ty": 0, "refId": "outer"}]},
+        ]
+
+        layers = get_text_layers(lottie_with_text)
+
+        assert [t["text"] for t in layers] == ["Hello World", "Welcome"]
+        assert layers[0]["path"] == "assets[inner].layers[0]"
+
 
 # =============================================================================
 # Color Operations Tests
@@ -428,6 +609,18 @@ class TestColorOperations:
         fill = lottie_with_shapes["layers"][0]["shapes"][0]["it"][1]
         assert fill["c"]["k"][:3] == [0.0, 1.0, 0.0]
 
+    def test_transform_colors_map_matches_reported_hex(self):
+        """A channel ending in 5 (0.945) still matches its reported hex."""
+        original = [0.357, 0.482, 0.945, 1]
+        data = {"layers": [{"c": {"k": list(original)}}]}
+        reported = lottie_rgb_to_hex(original[:3])
+
+        count = transform_colors(data, color_map={reported: "#000000"})
+
+        assert reported == "#5b7af0"
+        assert count == 1
+        assert data["layers"][0]["c"]["k"] == [0.0, 0.0, 0.0, 1]
+
     def test_transform_colors_with_function(self, lottie_with_shapes):
         """Transform colors using function."""
         count = transform_colors(
@@ -437,12 +630,59 @@ class TestColorOperations:
 
         assert count >= 1
 
+    def test_transform_colors_without_rules_is_noop(self, lottie_with_shapes):
+        """No color map and no function leaves the data untouched."""
+        before = json.dumps(lottie_with_shapes)
+
+        assert transform_colors(lottie_with_shapes) == 0
+        assert transform_colors(lottie_with_shapes, color_map={}) == 0
+        assert json.dumps(lottie_with_shapes) == before
+
+    def test_transform_colors_deep_and_cyclic(self):
+        """Colors are found at any depth and shared/cyclic nodes are visited once."""
+        node = {"c": {"k": [1, 0, 0]}}
+        data = {"layers": [node]}
+        for _ in range(100):
+            node["it"] = [{"c": {"k": [1, 0, 0]}}]
+            node = node["it"][0]
+        node["loop"] = data  # cycle back to the root
+
+        count = transform_colors(data, color_map={"#FF0000": "#0000FF"})
+
+        assert count == 101
+        assert node["c"]["k"] == [0.0, 0.0, 1.0]
+
     def test_noir_transform(self):
         """Noir transform creates grayscale with warmth."""
         rgb = noir_transform([1, 0, 0])  # Red
         # Should be grayish with slight warm tint
         assert rgb[0] > rgb[2]  # More red than blue
 
+    @pytest.mark.parametrize(
+        "transform", [cyberpunk_transform, noir_transform, invert_transform]
+    )
+    def test_batched_presets_match_scalar(self, transform):
+        """Large batches of preset transforms match the per-color functions."""
+        pytest.importorskip("numpy")
+        colors = [
+            [round(i / 255, 3), round((i * 7 % 256) / 255, 3), round((i * 13 % 256) / 255, 3), 1]
+            for i in range(256)
+        ]
+        data = {"layers": [{"c": {"k": list(c)}} for c in colors]}
+
+        transform_colors(data, transform_fn=transform)
+
+        for layer, original in zip(data["layers"], colors):
+            assert layer["c"]["k"][:3] == transform(original[:3])
+            assert layer["c"]["k"][3] == 1
+
+    def test_import_does_not_load_numba(self):
+        """numba is only imported once a batch needs the JIT kernels."""
+        code = "import sys, nolan.lottie; sys.exit('numba' in sys.modules)"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run([sys.executable, "-c", code], env=env)
+        assert result.returncode == 0
+
 
 # =============================================================================
 # Timing and Dimensions Tests
@@ -483,6 +723,51 @@ class TestTimingAndDimensions:
         assert sample_lottie["h"] == 2160
 
 
+# =============================================================================
+# Customization API Tests
+# =============================================================================
+
+class TestCustomizeLottie:
+    """Tests for the customize_lottie entry points."""
+
+    def test_customize_lottie(self, lottie_with_text, tmp_path):
+        """Text, timing and dimensions are applied and saved."""
+        src = tmp_path / "in.json"
+        out = tmp_path / "out.json"
+        save_lottie(lottie_with_text, src)
+
+        data = customize_lottie(
+            src, out,
+            text_replacements={"Hello World": "Hi"},
+            fps=60,
+            width=640,
+        )
+
+        assert get_text_layers(data)[0]["text"] == "Hi"
+        assert load_lottie(out)["fr"] == 60
+        assert load_lottie(out)["w"] == 640
+
+    def test_customize_lottie_batch(self, lottie_with_text, tmp_path):
+        """Batch jobs run independently and return results in job order."""
+        src = tmp_path / "in.json"
+        save_lottie(lottie_with_text, src)
+        jobs = [
+            {
+                "input_path": src,
+                "output_path": tmp_path / f"out{i}.json",
+                "text_replacements": {"Hello World": f"Title {i}"},
+            }
+            for i in range(5)
+        ]
+
+        results = customize_lottie_batch(jobs, max_workers=3)
+
+        assert [get_text_layers(r)[0]["text"] for r in results] == [
+            f"Title {i}" for i in range(5)
+        ]
+        assert get_text_layers(load_lottie(tmp_path / "out4.json"))[0]["text"] == "Title 4"
+
+
 # =============================================================================
 # Schema System Tests
 # =============================================================================
@@ -0,0 +1,126 @@
+"""Tests for QualityProtocol frame extraction helpers."""
+
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import nolan.quality.protocol as qp
+from nolan.quality import QualityProtocol
+
+
+def _bmp(payload: bytes) -> bytes:
+    """Minimal BMP-shaped blob: 'BM', little-endian total size, then payload."""
+    return b"BM" + (6 + len(payload)).to_bytes(4, "little") + payload
+
+
+def _run_result(returncode=0, stdout=b"", stderr=b""):
+    return SimpleNamespace(returncode=returncode, stdout=stdout, stderr=stderr)
+
+
+def test_split_bmp_stream_concatenated():
+    frames = [_bmp(b"a" * 10), _bmp(b"bb"), _bmp(b"c" * 300)]
+    assert qp._split_bmp_stream(b"".join(frames)) == frames
+
+
+def test_split_bmp_stream_drops_truncated_tail():
+    whole = _bmp(b"x" * 20)
+    truncated = _bmp(b"y" * 20)[:-5]
+    assert qp._split_bmp_stream(whole + truncated) == [whole]
+
+
+def test_split_bmp_stream_stops_at_non_bmp_data():
+    whole = _bmp(b"x" * 8)
+    assert qp._split_bmp_stream(whole + b"garbage") == [whole]
+    assert qp._split_bmp_stream(b"") == []
+
+
+def test_extract_frames_single_ffmpeg_command():
+    qa = QualityProtocol()
+    frames = [_bmp(b"1"), _bmp(b"2"), _bmp(b"3")]
+    captured = {}
+
+    def fake_run(cmd, **kw):
+        captured["cmd"] = cmd
+        return _run_result(stdout=b"".join(frames))
+
+    with patch.object(qp.subprocess, "run", side_effect=fake_run):
+        out = qa._extract_frames(Path("clip.mp4"), [0.5, 1.0, 1.5], scale_width=240)
+
+    assert out == frames
+    cmd = captured["cmd"]
+    assert cmd[0] == "ffmpeg"
+    assert cmd[1:13] == [
+        "-ss", "0.5", "-i", "clip.mp4",
+        "-ss", "1.0", "-i", "clip.mp4",
+        "-ss", "1.5", "-i", "clip.mp4",
+    ]
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert graph.count("trim=end_frame=1,scale=w='min(240,iw)'") == 3
+    assert graph.endswith("[f0][f1][f2]concat=n=3:v=1:a=0[out]")
+    # -vsync rather than -fps_mode, which ffmpeg 4.x doesn't understand
+    assert cmd[cmd.index("-vsync") + 1] == "0"
+    assert cmd[-5:] == ["-f", "image2pipe", "-vcodec", "bmp", "-"]
+
+
+def test_extract_frames_falls_back_and_logs(caplog):
+    qa = QualityProtocol()
+    failed = _run_result(returncode=1, stderr=b"Invalid data found")
+
+    with patch.object(qp.subprocess, "run", return_value=failed), \
+            patch.object(qa, "_extract_frame", side_effect=lambda p, t, w: f"frame@{t}") as single, \
+            caplog.at_level(logging.WARNING, logger=qp.__name__):
+        out = qa._extract_frames(Path("clip.mp4"), [1.0, 2.0])
+
+    assert out == ["frame@1.0", "frame@2.0"]
+    assert single.call_count == 2
+    assert "Invalid data found" in caplog.text
+
+
+def test_extract_frames_frame_count_mismatch_falls_back(caplog):
+    qa = QualityProtocol()
+    short = _run_result(stdout=_bmp(b"only one"))
+
+    with patch.object(qp.subprocess, "run", return_value=short), \
+            patch.object(qa, "_extract_frame", return_value=b"single"), \
+            caplog.at_level(logging.WARNING, logger=qp.__name__):
+        out = qa._extract_frames(Path("clip.mp4"), [1.0, 2.0, 3.0])
+
+    assert out == [b"single"] * 3
+    assert "got 1 frames for 3 timestamps" in caplog.text
+
+
+def test_video_properties_cached_until_file_changes(tmp_path):
+    qa = QualityProtocol()
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"v1")
+
+    with patch.object(qa, "_probe_video_properties", return_value={"width": 1920}) as probe:
+        first = qa._get_video_properties(video)
+        first["width"] = 0  # callers get a copy
+        assert qa._get_video_properties(video) == {"width": 1920}
+        assert probe.call_count == 1
+
+        video.write_bytes(b"version 2")
+        qa._get_video_properties(video)
+        assert probe.call_count == 2
+
+    # The stale entry was replaced, not kept alongside
+    assert len(qa._props_cache) == 1
+
+
+def test_video_properties_cache_is_bounded(tmp_path):
+    qa = QualityProtocol()
+    paths = []
+    for i in range(qp._PROPS_CACHE_SIZE + 5):
+        path = tmp_path / f"clip{i}.mp4"
+        path.write_bytes(b"x")
+        paths.append(path)
+
+    with patch.object(qa, "_probe_video_properties", return_value={}):
+        for path in paths:
+            qa._get_video_properties(path)
+
+    assert len(qa._props_cache) == qp._PROPS_CACHE_SIZE
+    assert str(paths[0]) not in qa._props_cache
+    assert str(paths[-1]) in qa._props_cache
@@ -0,0 +1,132 @@
+"""Tests for the visual text check's image comparison helpers."""
+
+import io
+
+import numpy as np
+import pytest
+
+from nolan.quality.checks.visual_text import (
+    _comparison_array,
+    _reference_text_array,
+    calculate_structural_similarity,
+    create_reference_text_image,
+)
+
+
+def _gradient(height=100, width=200):
+    """Deterministic 200x100 grayscale test image with local structure."""
+    y, x = np.mgrid[0:height, 0:width]
+    return ((x * 3 + y * 5) % 256).astype(np.float64)
+
+
+def _list_ncc(pixels1, pixels2):
+    """The original pure-Python correlation, kept as the parity reference."""
+    mean1 = sum(pixels1) / len(pixels1)
+    mean2 = sum(pixels2) / len(pixels2)
+
+    numerator = sum((p1 - mean1) * (p2 - mean2) for p1, p2 in zip(pixels1, pixels2))
+    denom1 = sum((p1 - mean1) ** 2 for p1 in pixels1) ** 0.5
+    denom2 = sum((p2 - mean2) ** 2 for p2 in pixels2) ** 0.5
+
+    if denom1 == 0 or denom2 == 0:
+        return 0.0
+    return (numerator / (denom1 * denom2) + 1) / 2
+
+
+@pytest.mark.parametrize("second", ["same", "noisy", "inverted", "shifted", "constant"])
+def test_structural_similarity_matches_list_implementation(second):
+    img = _gradient()
+    rng = np.random.default_rng(1)
+    other = {
+        "same": img.copy(),
+        "noisy": np.clip(np.rint(img + rng.normal(0, 30, img.shape)), 0, 255),
+        "inverted": 255 - img,
+        "shifted": np.roll(img, 7, axis=1),
+        "constant": np.full_like(img, 26.0),
+    }[second]
+
+    expected = _list_ncc(img.ravel().tolist(), other.ravel().tolist())
+    assert calculate_structural_similarity(img, other) == pytest.approx(expected, abs=1e-12)
+
+
+def test_structural_similarity_accepts_png_bytes():
+    Image = pytest.importorskip("PIL.Image")
+    img = _gradient()
+    other = np.roll(img, 7, axis=1)
+
+    def png(arr):
+        buffer = io.BytesIO()
+        Image.fromarray(arr.astype(np.uint8)).save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    expected = _list_ncc(img.ravel().tolist(), other.ravel().tolist())
+    assert calculate_structural_similarity(png(img), png(other)) == pytest.approx(expected, abs=1e-12)
+
+
+def test_structural_similarity_constant_images():
+    """Zero variance on either side scores 0.0, as before."""
+    flat = np.full((100, 200), 128.0)
+    assert calculate_structural_similarity(flat, flat.copy()) == 0.0
+    assert calculate_structural_similarity(_gradient(), flat) == 0.0
+
+
+def test_structural_similarity_does_not_modify_inputs():
+    img = _gradient()
+    original = img.copy()
+    calculate_structural_similarity(img, 255 - img)
+    assert np.array_equal(img, original)
+
+
+def test_reference_array_matches_png_path():
+    pytest.importorskip("PIL")
+    png = create_reference_text_image("WE ARE TIRED")
+    array = _reference_text_array("WE ARE TIRED")
+
+    assert png is not None
+    assert array.shape == (100, 200)
+    assert np.array_equal(array, _comparison_array(png))
+
+
+def test_reference_array_is_cached_read_only():
+    pytest.importorskip("PIL")
+    array = _reference_text_array("CACHED")
+
+    assert _reference_text_array("CACHED") is array
+    assert not array.flags.writeable
+    with pytest.raises(ValueError):
+        array[0, 0] = 0
+
+
+def _glyph_frame(shift=0):
+    """1920x1080 frame with a fixed scatter of bright glyph-like blocks."""
+    from PIL import Image
+
+    rng = np.random.default_rng(7)
+    frame = np.full((1080, 1920), 26, dtype=np.uint8)
+    for _ in range(40):
+        x, y = int(rng.integers(480, 1400)), int(rng.integers(480, 580))
+        w, h = int(rng.integers(8, 40)), int(rng.integers(8, 60))
+        frame[y:y + h, x + shift:x + shift + w] = 255
+    return Image.fromarray(frame)
+
+
+@pytest.mark.parametrize("shift, passes", [(4, True), (20, True), (30, False)])
+def test_box_downsample_keeps_threshold_verdict(shift, passes):
+    """BOX resampling gives the same pass/fail as the old bicubic resize."""
+    Image = pytest.importorskip("PIL.Image")
+    threshold = 0.7  # check_text_rendering's default similarity_threshold
+    reference, frame = _glyph_frame(), _glyph_frame(shift)
+
+    def png(img):
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    def bicubic(img):
+        return np.array(img.resize((200, 100), Image.BICUBIC), dtype=np.float64)
+
+    box_score = calculate_structural_similarity(png(reference), png(frame))
+    bicubic_score = calculate_structural_similarity(bicubic(reference), bicubic(frame))
+
+    assert (box_score >= threshold) is passes
+    assert (bicubic_score >= threshold) is passes